@@ -1,31 +1,346 @@
 """
 Jira Integration Plugin for Dev Orchestrator
 Provides tools for creating, updating, and managing Jira issues.
+
+The jira package (which drags in requests, oauthlib, etc.) is imported
+lazily on first tool call: MCP servers are spawned as subprocesses, and
+sessions that only list tools shouldn't pay a few hundred ms of cold-start
+import for a client they never use.
 """
+from __future__ import annotations
+
+import difflib
+import functools
+import io
 import os
 import json
-from typing import Any, Dict, List, Optional
+import logging
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Callable, Dict, List, Optional, TYPE_CHECKING
 from mcp.server import Server
 from mcp.types import Tool, TextContent
 import asyncio
 
-try:
+if TYPE_CHECKING:
     from jira import JIRA
-    from jira.exceptions import JIRAError
+
+try:
+    import orjson
 except ImportError:
-    raise ImportError("jira package is required. Install with: pip install jira>=3.5.0")
+    orjson = None  # optional speedup; stdlib json is the fallback
 
 # Initialize MCP server
 server = Server("jira-integration")
 
+logger = logging.getLogger("jira-integration")
+
+
+# Tool output goes to a model, which gains nothing from pretty-printing —
+# indentation roughly doubles payload bytes and encode time. Set
+# DEBUG_PRETTY_JSON=1 when a human needs to read the raw responses.
+_PRETTY_JSON = os.getenv("DEBUG_PRETTY_JSON") == "1"
+
+
+def _dumps(obj: Any, indent: Optional[bool] = None) -> str:
+    """JSON-encode tool output, using orjson when available.
+
+    orjson's C encoder is several times faster than the stdlib on large
+    payloads; the stdlib fallback keeps the plugin working without it.
+    Output is compact unless DEBUG_PRETTY_JSON is set (or indent is forced).
+    """
+    if indent is None:
+        indent = _PRETTY_JSON
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0).decode()
+    return json.dumps(obj, indent=2 if indent else None)
+
+# Default page size for paginated search requests. The jira library batches
+# at 50 issues per page out of the box, which means a 7000-issue query costs
+# ~140 round-trips; 500 per page cuts that to 14.
+DEFAULT_SEARCH_BATCH_SIZE = 500
+
+
+class TokenBucket:
+    """Thread-safe token bucket limiting outbound requests per second.
+
+    Parallel search windows and bulk fetches can burst well past Jira's
+    allowance and trigger 429 storms; smoothing at the source keeps
+    throughput near the allowed rate instead of thrash-and-retry.
+    """
+
+    def __init__(self, rate: float):
+        self.rate = rate
+        self.capacity = rate
+        self._tokens = rate
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Block until a token is available."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+    def set_rate(self, rate: float) -> None:
+        """Adjust the refill rate (e.g., from server rate-limit headers)."""
+        with self._lock:
+            self.rate = rate
+            self.capacity = max(rate, 1.0)
+
+
+class CircuitBreaker:
+    """Fail fast when Jira looks down instead of paying a timeout per call.
+
+    Counts consecutive connection/server errors; once fail_max is reached the
+    circuit opens and calls are rejected immediately until reset_timeout has
+    passed, after which traffic is allowed through to probe recovery. Rate
+    limiting (429) does not count — that is handled by retries and means the
+    server is up.
+    """
+
+    def __init__(self, fail_max: int, reset_timeout: float):
+        self.fail_max = fail_max
+        self.reset_timeout = reset_timeout
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._lock = threading.Lock()
+
+    def seconds_until_retry(self) -> Optional[float]:
+        """Time left before the circuit allows traffic, or None if it does."""
+        with self._lock:
+            if self._opened_at is None:
+                return None
+            remaining = self.reset_timeout - (time.monotonic() - self._opened_at)
+            return remaining if remaining > 0 else None
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self._failures >= self.fail_max:
+                self._opened_at = time.monotonic()
+
+
+class TTLCache:
+    """Minimal thread-safe TTL cache for Jira metadata that changes rarely.
+
+    Bounded: inserting past maxsize first sweeps expired entries, then
+    evicts the oldest. Without the cap, per-issue keys (transitions) would
+    accumulate dead entries for as long as the server lives, since expired
+    entries are otherwise only dropped when the same key is read again.
+    """
+
+    def __init__(self, ttl: float, maxsize: int = 1024):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._data: Dict[Any, Any] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: Any) -> Optional[Any]:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            expires, value = entry
+            if time.monotonic() >= expires:
+                del self._data[key]
+                return None
+            return value
+
+    def set(self, key: Any, value: Any) -> None:
+        with self._lock:
+            if key not in self._data and len(self._data) >= self.maxsize:
+                self._evict()
+            self._data[key] = (time.monotonic() + self.ttl, value)
+
+    def _evict(self) -> None:
+        """Make room for one insert; caller must hold the lock."""
+        now = time.monotonic()
+        expired = [key for key, (expires, _) in self._data.items() if expires <= now]
+        for key in expired:
+            del self._data[key]
+        while len(self._data) >= self.maxsize:
+            oldest = min(self._data, key=lambda k: self._data[k][0])
+            del self._data[oldest]
+
+    def invalidate(self, key: Any = None) -> None:
+        """Drop one entry, or everything if no key is given."""
+        with self._lock:
+            if key is None:
+                self._data.clear()
+            else:
+                self._data.pop(key, None)
+
+
+@functools.lru_cache(maxsize=None)
+def _client_classes():
+    """Import the jira stack and build our tuned client classes.
+
+    Cached so the import and class construction happen once, on the first
+    tool call. Returns (PagedJIRA, RateLimitRetry, HTTPAdapter).
+    """
+    try:
+        from jira import JIRA
+    except ImportError:
+        raise ImportError("jira package is required. Install with: pip install jira>=3.5.0")
+
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    class RateLimitRetry(Retry):
+        """Retry policy tuned for Jira's rate limiting.
+
+        Honors Retry-After, but adds a small random jitter on top of whatever
+        the server suggests. Jira sometimes answers 429 with Retry-After: 0,
+        which would otherwise make concurrent workers retry in lockstep and
+        immediately trip the limit again.
+        """
+
+        max_jitter = 1.0
+
+        def get_retry_after(self, response):
+            suggested = super().get_retry_after(response)
+            if suggested is None:
+                return None
+            return suggested + self.max_jitter * random.random()
+
+    class PagedJIRA(JIRA):
+        """JIRA client that paginates with a configurable page size.
+
+        When a caller asks for unbounded results (maxResults=False), the
+        stock client fetches pages at the server's default size (50). This
+        subclass requests `batch_size` issues per page instead. The library
+        reads the actual page size back from each response, so if the server
+        grants fewer we still paginate correctly.
+        """
+
+        batch_size: int = DEFAULT_SEARCH_BATCH_SIZE
+
+        def _fetch_pages(self, item_type, items_key, request_path, startAt=0, maxResults=50, params=None, base=JIRA.JIRA_BASE_URL, use_post=False):
+            if not maxResults:
+                params = dict(params or {})
+                params["maxResults"] = self.batch_size
+            return super()._fetch_pages(
+                item_type, items_key, request_path,
+                startAt=startAt, maxResults=maxResults, params=params,
+                base=base, use_post=use_post
+            )
+
+    return PagedJIRA, RateLimitRetry, HTTPAdapter
+
+
+# Concurrent windows used when fetching large search results. Kept modest so
+# parallel fanout doesn't trip Jira's rate limiting.
+SEARCH_PARALLEL_WORKERS = 8
+
+# Outbound requests per second across all worker threads
+DEFAULT_RATE_LIMIT_RPS = 10.0
+
+# Connection pool size for the Jira session. requests defaults to 10 per
+# host, so parallel fanout past that tears connections down and pays a fresh
+# TLS handshake on the next request.
+HTTP_POOL_SIZE = 64
+
+# Consecutive failures before the circuit opens, and how long it stays open
+CIRCUIT_FAIL_MAX = 5
+CIRCUIT_RESET_TIMEOUT = 30.0
+
+# How long cached Jira metadata (transitions, projects) stays fresh
+METADATA_CACHE_TTL = 300.0
+
+# Valid field values (versions, components, labels) change much less often
+# than issue metadata, so they get a longer TTL
+FIELD_VALUES_CACHE_TTL = 1800.0
+
+# Fields the tools actually serialize. Asking Jira for only these (instead of
+# every field, custom fields included) keeps payloads small on big searches.
+SEARCH_DEFAULT_FIELDS = [
+    "summary", "status", "issuetype", "assignee",
+    "reporter", "priority", "created", "updated"
+]
+ISSUE_DEFAULT_FIELDS = SEARCH_DEFAULT_FIELDS + ["description", "labels"]
+
 # Global Jira client
 _jira_client: Optional[JIRA] = None
 
+# Base URL for building browse links, cached at client setup.
+# jira.client_info() costs a serverInfo REST call per invocation, but the
+# URL we need is just the configured server address.
+_jira_base_url: Optional[str] = None
+
+
+def _base_url() -> str:
+    """Browse-link base URL for the configured Jira instance."""
+    if _jira_base_url is None:
+        get_jira_client()
+    return _jira_base_url
+
+# Shared limiter for all outbound Jira traffic
+_throttler = TokenBucket(DEFAULT_RATE_LIMIT_RPS)
+
+# Trips on consecutive outage-style failures so tool calls fail fast while
+# Jira is down instead of blocking a worker thread per call
+_circuit = CircuitBreaker(CIRCUIT_FAIL_MAX, CIRCUIT_RESET_TIMEOUT)
+
+# Metadata caches: transitions are keyed by issue key (invalidated when the
+# issue is updated or transitioned, since its workflow position changes);
+# the project list is cached whole.
+_transitions_cache = TTLCache(METADATA_CACHE_TTL)
+_projects_cache = TTLCache(METADATA_CACHE_TTL)
+_field_values_cache = TTLCache(FIELD_VALUES_CACHE_TTL)
+
+
+def _get_transitions(jira: JIRA, issue_key: str, cache_bypass: bool = False) -> List[Dict[str, Any]]:
+    """Get available transitions for an issue, served from cache when fresh."""
+    if not cache_bypass:
+        cached = _transitions_cache.get(issue_key)
+        if cached is not None:
+            return cached
+    transitions = jira.transitions(issue_key)
+    _transitions_cache.set(issue_key, transitions)
+    return transitions
+
+
+def _throttle_session(session) -> None:
+    """Gate every outbound request on `session` through the shared bucket.
+
+    Also feeds the server's advertised fill rate (X-RateLimit-FillRate)
+    back into the bucket so we track the allowance Jira actually grants.
+    """
+    original = session.request
+
+    def throttled_request(*args, **kwargs):
+        _throttler.acquire()
+        response = original(*args, **kwargs)
+        fill_rate = response.headers.get("X-RateLimit-FillRate")
+        if fill_rate:
+            try:
+                _throttler.set_rate(float(fill_rate))
+            except ValueError:
+                pass
+        return response
+
+    session.request = throttled_request
+
 
 def get_jira_client() -> JIRA:
     """Get or create Jira client instance."""
-    global _jira_client
-    
+    global _jira_client, _jira_base_url
+
     if _jira_client is None:
         jira_url = os.getenv("JIRA_URL")
         jira_email = os.getenv("JIRA_EMAIL")
@@ -36,448 +351,1036 @@ def get_jira_client() -> JIRA:
                 "Missing Jira configuration. Required environment variables: "
                 "JIRA_URL, JIRA_EMAIL, JIRA_API_TOKEN"
             )
-        
-        _jira_client = JIRA(
+
+        PagedJIRA, RateLimitRetry, HTTPAdapter = _client_classes()
+
+        _jira_client = PagedJIRA(
             server=jira_url,
-            basic_auth=(jira_email, jira_token)
+            basic_auth=(jira_email, jira_token),
+            max_retries=3
         )
-    
+
+        # Retry 429/503 at the transport layer so rate limiting recovers
+        # transparently instead of surfacing an error to the caller
+        retry = RateLimitRetry(
+            total=5,
+            backoff_factor=1.5,
+            status_forcelist=[429, 503],
+            allowed_methods=None,  # 429/503 mean "not processed", safe for any verb
+            respect_retry_after_header=True
+        )
+        adapter = HTTPAdapter(
+            pool_connections=HTTP_POOL_SIZE,
+            pool_maxsize=HTTP_POOL_SIZE,
+            max_retries=retry
+        )
+        _jira_client._session.mount("https://", adapter)
+        _jira_client._session.mount("http://", adapter)
+        _jira_client._session.headers["Connection"] = "keep-alive"
+
+        _throttle_session(_jira_client._session)
+
+        _jira_base_url = jira_url.rstrip("/")
+
     return _jira_client
 
 
-@server.list_tools()
-async def list_tools() -> List[Tool]:
-    """List available Jira tools."""
-    return [
-        Tool(
-            name="jira_search_issues",
-            description="Search Jira issues using JQL (Jira Query Language)",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "jql": {
-                        "type": "string",
-                        "description": "JQL query string (e.g., 'project = MYPROJ AND status = Open')"
-                    },
-                    "max_results": {
-                        "type": "integer",
-                        "description": "Maximum number of results to return",
-                        "default": 50
-                    },
-                    "fields": {
-                        "type": "array",
-                        "items": {"type": "string"},
-                        "description": "Specific fields to return (optional)"
-                    }
+def _issue_to_dict(issue: Any) -> Dict[str, Any]:
+    """Serialize a Jira issue into the dict shape returned by the get tools.
+
+    Tolerates absent attributes so callers can narrow the requested fields
+    without breaking serialization.
+    """
+    fields = issue.fields
+    assignee = getattr(fields, "assignee", None)
+    reporter = getattr(fields, "reporter", None)
+    priority = getattr(fields, "priority", None)
+    status = getattr(fields, "status", None)
+    issue_type = getattr(fields, "issuetype", None)
+    created = getattr(fields, "created", None)
+    updated = getattr(fields, "updated", None)
+    return {
+        "key": issue.key,
+        "summary": getattr(fields, "summary", None),
+        "description": getattr(fields, "description", None),
+        "status": status.name if status else None,
+        "issue_type": issue_type.name if issue_type else None,
+        "assignee": assignee.displayName if assignee else "Unassigned",
+        "reporter": reporter.displayName if reporter else None,
+        "priority": priority.name if priority else None,
+        "labels": getattr(fields, "labels", []),
+        "created": str(created) if created else None,
+        "updated": str(updated) if updated else None,
+        "url": f"{_base_url()}/browse/{issue.key}"
+    }
+
+
+_warned_page_cap = False
+
+
+def _warn_page_cap(granted: int, requested: int) -> None:
+    """Log once when the server grants smaller search pages than requested."""
+    global _warned_page_cap
+    if not _warned_page_cap:
+        _warned_page_cap = True
+        logger.warning(
+            "Jira capped page size at %d (requested %d); "
+            "large searches will need more round-trips",
+            granted, requested
+        )
+
+
+def _search_issues_parallel(jira: JIRA, jql: str, max_results: int, fields: Optional[List[str]], batch_size: int) -> List[Dict[str, Any]]:
+    """Fetch a large search result set using parallel startAt windows.
+
+    Jira returns the total match count on every search response, so one cheap
+    maxResults=0 call tells us how many windows we need. The windows are then
+    fetched concurrently instead of paging serially, turning O(total/page)
+    sequential round-trips into O(total/(page*workers)).
+
+    Returns raw issue dicts (json_result) rather than Resource objects.
+    """
+    page = batch_size
+
+    response = jira._session.get(
+        f"{jira._options['server']}/rest/api/2/search",
+        params={"jql": jql, "maxResults": 0},
+    )
+    total = response.json().get("total", 0)
+    if max_results:
+        total = min(total, max_results)
+    if total <= 0:
+        return []
+
+    def fetch_window(offset: int) -> List[Dict[str, Any]]:
+        # A single json_result call returns one page with no pagination, and
+        # servers cap the page size below batch_size — so keep requesting
+        # until the window is filled or the results run out
+        window: List[Dict[str, Any]] = []
+        remaining = min(page, total - offset)
+        while remaining > 0:
+            result = jira.search_issues(
+                jql, startAt=offset + len(window), maxResults=remaining,
+                fields=fields, json_result=True
+            )
+            batch = result.get("issues", [])
+            if not batch:
+                break
+            if len(batch) < remaining:
+                _warn_page_cap(len(batch), remaining)
+            window.extend(batch)
+            remaining -= len(batch)
+        return window
+
+    with ThreadPoolExecutor(max_workers=SEARCH_PARALLEL_WORKERS) as pool:
+        # map() preserves submission order, so issues come back sorted by startAt
+        pages = pool.map(fetch_window, range(0, total, page))
+
+    issues: List[Dict[str, Any]] = []
+    for window in pages:
+        issues.extend(window)
+    return issues
+
+
+def _search_issues_cloud(jira: JIRA, jql: str, max_results: int, fields: Optional[List[str]], batch_size: int) -> List[Dict[str, Any]]:
+    """Page the Cloud enhanced search serially via nextPageToken.
+
+    Offset-based /search windows are deprecated on Jira Cloud (the library
+    raises for startAt != 0 from 3.10), and its token walk only paginates
+    for unbounded requests — a bounded maxResults issues exactly one request
+    and returns the single server-capped page. Loop on the token here so
+    bounded searches aren't silently truncated at the server's page cap.
+    """
+    issues: List[Dict[str, Any]] = []
+    token = None
+    while True:
+        want = min(batch_size, max_results - len(issues)) if max_results else batch_size
+        page = jira.enhanced_search_issues(
+            jql, nextPageToken=token, maxResults=want,
+            fields=fields, json_result=True
+        )
+        batch = page.get("issues", [])
+        issues.extend(batch)
+        token = page.get("nextPageToken")
+        if not batch or token is None:
+            break
+        if max_results and len(issues) >= max_results:
+            break
+    if max_results:
+        del issues[max_results:]
+    return issues
+
+
+def _fetch_projects(jira: JIRA, include_archived: bool) -> List[Dict[str, Any]]:
+    """List projects via /project/search, filtering archived server-side.
+
+    The plain /project endpoint returns everything and left us filtering
+    archived projects client-side; /project/search filters by status on the
+    server and paginates, so we only ever transfer what we return.
+
+    /project/search only exists on Jira Cloud, so Server/Data Center keeps
+    the classic endpoint with the client-side archived filter, normalized
+    to the same dict shape.
+    """
+    if not getattr(jira, "_is_cloud", False):
+        projects: List[Dict[str, Any]] = []
+        for project in jira.projects():
+            if not include_archived and getattr(project, "archived", False):
+                continue
+            projects.append({
+                "key": project.key,
+                "name": project.name,
+                "lead": (
+                    {"displayName": project.lead.displayName}
+                    if hasattr(project, "lead") else None
+                ),
+            })
+        return projects
+
+    url = f"{jira._options['server']}/rest/api/3/project/search"
+    statuses = ["live", "archived"] if include_archived else ["live"]
+    params: Dict[str, Any] = {
+        "status": statuses, "expand": "lead", "maxResults": 100, "startAt": 0
+    }
+
+    projects: List[Dict[str, Any]] = []
+    while True:
+        page = jira._session.get(url, params=params).json()
+        values = page.get("values", [])
+        projects.extend(values)
+        if page.get("isLast", True) or not values:
+            break
+        params["startAt"] += len(values)
+    return projects
+
+
+def _fetch_field_values(jira: JIRA, field: str, project: Optional[str]) -> List[str]:
+    """Fetch the set of valid values for a categorical Jira field."""
+    if field == "fixVersion":
+        return [v.name for v in jira.project_versions(project)]
+
+    if field == "component":
+        return [c.name for c in jira.project_components(project)]
+
+    if field == "priority":
+        return [p.name for p in jira.priorities()]
+
+    if field == "status":
+        return [s.name for s in jira.statuses()]
+
+    if field == "labels":
+        # The label list endpoint only exists on Jira Cloud; the handler
+        # turns this away with a clear message before we get here
+        url = f"{jira._options['server']}/rest/api/2/label"
+        params: Dict[str, Any] = {"startAt": 0, "maxResults": 1000}
+        values: List[str] = []
+        while True:
+            page = jira._session.get(url, params=params).json()
+            batch = page.get("values", [])
+            values.extend(batch)
+            if page.get("isLast", True) or not batch:
+                break
+            params["startAt"] += len(batch)
+        return values
+
+    raise ValueError(f"Unsupported field: {field}")
+
+
+def _serialize_search_results(issues: List[Dict[str, Any]]) -> str:
+    """Serialize raw issue dicts into a JSON array, one issue at a time.
+
+    Writing incrementally keeps peak memory at one transformed issue plus the
+    output buffer instead of a full second list of dicts. Output is compact
+    (no indent): pretty-printing roughly doubles both the payload size and
+    the serialization time on large result sets.
+    """
+    buf = io.StringIO()
+    write = buf.write
+    write("[\n")
+    for i, issue in enumerate(issues):
+        # Raw dicts from json_result: plain key lookups, no Resource
+        # __getattr__ or str() conversions. Bind the sub-dicts once instead
+        # of re-allocating empty fallbacks per field.
+        f = issue.get("fields") or {}
+        status = f.get("status")
+        issue_type = f.get("issuetype")
+        assignee = f.get("assignee")
+        reporter = f.get("reporter")
+        priority = f.get("priority")
+        issue_data = {
+            "key": issue.get("key"),
+            "summary": f.get("summary"),
+            "status": status.get("name") if status else None,
+            "issue_type": issue_type.get("name") if issue_type else None,
+            "assignee": assignee.get("displayName") if assignee else "Unassigned",
+            "reporter": reporter.get("displayName") if reporter else None,
+            "priority": priority.get("name") if priority else None,
+            "created": f.get("created"),
+            "updated": f.get("updated"),
+        }
+        if i:
+            write(",\n")
+        write(_dumps(issue_data, indent=False))
+    write("\n]")
+    return buf.getvalue()
+
+
+# Tool schemas are static, so build them once at import time instead of
+# re-allocating the list on every list_tools RPC
+_TOOLS: List[Tool] = [
+    Tool(
+        name="jira_search_issues",
+        description="Search Jira issues using JQL (Jira Query Language)",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "jql": {
+                    "type": "string",
+                    "description": "JQL query string (e.g., 'project = MYPROJ AND status = Open')"
                 },
-                "required": ["jql"]
-            }
-        ),
-        Tool(
-            name="jira_get_issue",
-            description="Get detailed information about a specific Jira issue",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "issue_key": {
-                        "type": "string",
-                        "description": "Issue key (e.g., 'PROJ-123')"
-                    },
-                    "expand": {
-                        "type": "array",
-                        "items": {"type": "string"},
-                        "description": "Additional data to expand (e.g., ['changelog', 'comments'])"
-                    }
+                "max_results": {
+                    "type": "integer",
+                    "description": "Maximum number of results to return",
+                    "default": 50
                 },
-                "required": ["issue_key"]
-            }
-        ),
-        Tool(
-            name="jira_create_issue",
-            description="Create a new Jira issue",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "project": {
-                        "type": "string",
-                        "description": "Project key (e.g., 'PROJ')"
-                    },
-                    "summary": {
-                        "type": "string",
-                        "description": "Issue summary/title"
-                    },
-                    "description": {
-                        "type": "string",
-                        "description": "Issue description"
-                    },
-                    "issue_type": {
-                        "type": "string",
-                        "description": "Issue type (e.g., 'Bug', 'Story', 'Task')",
-                        "default": "Task"
-                    },
-                    "priority": {
-                        "type": "string",
-                        "description": "Priority (e.g., 'High', 'Medium', 'Low')"
-                    },
-                    "assignee": {
-                        "type": "string",
-                        "description": "Assignee username or email"
-                    },
-                    "labels": {
-                        "type": "array",
-                        "items": {"type": "string"},
-                        "description": "Issue labels"
-                    }
+                "batch_size": {
+                    "type": "integer",
+                    "description": "Issues fetched per request when paginating (larger = fewer round-trips)",
+                    "default": 500
                 },
-                "required": ["project", "summary", "issue_type"]
-            }
-        ),
-        Tool(
-            name="jira_update_issue",
-            description="Update an existing Jira issue",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "issue_key": {
-                        "type": "string",
-                        "description": "Issue key (e.g., 'PROJ-123')"
-                    },
-                    "summary": {
-                        "type": "string",
-                        "description": "New summary/title"
-                    },
-                    "description": {
-                        "type": "string",
-                        "description": "New description"
-                    },
-                    "priority": {
-                        "type": "string",
-                        "description": "New priority"
-                    },
-                    "assignee": {
-                        "type": "string",
-                        "description": "New assignee username or email"
-                    },
-                    "labels": {
-                        "type": "array",
-                        "items": {"type": "string"},
-                        "description": "New labels"
-                    }
+                "fields": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Specific fields to return (defaults to the fields shown in results)"
+                }
+            },
+            "required": ["jql"]
+        }
+    ),
+    Tool(
+        name="jira_get_issue",
+        description="Get detailed information about a specific Jira issue",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "issue_key": {
+                    "type": "string",
+                    "description": "Issue key (e.g., 'PROJ-123')"
                 },
-                "required": ["issue_key"]
-            }
-        ),
-        Tool(
-            name="jira_add_comment",
-            description="Add a comment to a Jira issue",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "issue_key": {
-                        "type": "string",
-                        "description": "Issue key (e.g., 'PROJ-123')"
-                    },
-                    "comment": {
-                        "type": "string",
-                        "description": "Comment text (supports Jira markdown)"
-                    }
+                "expand": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Additional data to expand (e.g., ['changelog', 'comments'])"
                 },
-                "required": ["issue_key", "comment"]
-            }
-        ),
-        Tool(
-            name="jira_transition_issue",
-            description="Change the status of a Jira issue (e.g., move to In Progress, Done)",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "issue_key": {
-                        "type": "string",
-                        "description": "Issue key (e.g., 'PROJ-123')"
-                    },
-                    "transition": {
-                        "type": "string",
-                        "description": "Transition name or ID (e.g., 'In Progress', 'Done', '21')"
+                "fields": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Specific fields to return (defaults to the fields shown in results)"
+                }
+            },
+            "required": ["issue_key"]
+        }
+    ),
+    Tool(
+        name="jira_get_issues_bulk",
+        description="Get details for multiple Jira issues at once (fetched in parallel)",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "issue_keys": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Issue keys to fetch (e.g., ['PROJ-1', 'PROJ-2'])"
+                },
+                "max_workers": {
+                    "type": "integer",
+                    "description": "Number of issues to fetch concurrently",
+                    "default": 5
+                }
+            },
+            "required": ["issue_keys"]
+        }
+    ),
+    Tool(
+        name="jira_create_issue",
+        description="Create a new Jira issue",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "project": {
+                    "type": "string",
+                    "description": "Project key (e.g., 'PROJ')"
+                },
+                "summary": {
+                    "type": "string",
+                    "description": "Issue summary/title"
+                },
+                "description": {
+                    "type": "string",
+                    "description": "Issue description"
+                },
+                "issue_type": {
+                    "type": "string",
+                    "description": "Issue type (e.g., 'Bug', 'Story', 'Task')",
+                    "default": "Task"
+                },
+                "priority": {
+                    "type": "string",
+                    "description": "Priority (e.g., 'High', 'Medium', 'Low')"
+                },
+                "assignee": {
+                    "type": "string",
+                    "description": "Assignee username or email"
+                },
+                "labels": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Issue labels"
+                }
+            },
+            "required": ["project", "summary", "issue_type"]
+        }
+    ),
+    Tool(
+        name="jira_create_issues_bulk",
+        description="Create multiple Jira issues in a single request (e.g., importing a backlog)",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "issues": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "project": {
+                                "type": "string",
+                                "description": "Project key (e.g., 'PROJ')"
+                            },
+                            "summary": {
+                                "type": "string",
+                                "description": "Issue summary/title"
+                            },
+                            "description": {
+                                "type": "string",
+                                "description": "Issue description"
+                            },
+                            "issue_type": {
+                                "type": "string",
+                                "description": "Issue type (e.g., 'Bug', 'Story', 'Task')",
+                                "default": "Task"
+                            },
+                            "priority": {
+                                "type": "string",
+                                "description": "Priority (e.g., 'High', 'Medium', 'Low')"
+                            },
+                            "assignee": {
+                                "type": "string",
+                                "description": "Assignee username or email"
+                            },
+                            "labels": {
+                                "type": "array",
+                                "items": {"type": "string"},
+                                "description": "Issue labels"
+                            }
+                        },
+                        "required": ["project", "summary"]
                     },
-                    "comment": {
-                        "type": "string",
-                        "description": "Optional comment when transitioning"
-                    }
+                    "description": "Issues to create"
+                }
+            },
+            "required": ["issues"]
+        }
+    ),
+    Tool(
+        name="jira_update_issue",
+        description="Update an existing Jira issue",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "issue_key": {
+                    "type": "string",
+                    "description": "Issue key (e.g., 'PROJ-123')"
                 },
-                "required": ["issue_key", "transition"]
-            }
-        ),
-        Tool(
-            name="jira_get_transitions",
-            description="Get available transitions (status changes) for a Jira issue",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "issue_key": {
-                        "type": "string",
-                        "description": "Issue key (e.g., 'PROJ-123')"
-                    }
+                "summary": {
+                    "type": "string",
+                    "description": "New summary/title"
                 },
-                "required": ["issue_key"]
-            }
-        ),
-        Tool(
-            name="jira_list_projects",
-            description="List all accessible Jira projects",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "include_archived": {
-                        "type": "boolean",
-                        "description": "Include archived projects",
-                        "default": False
-                    }
+                "description": {
+                    "type": "string",
+                    "description": "New description"
+                },
+                "priority": {
+                    "type": "string",
+                    "description": "New priority"
+                },
+                "assignee": {
+                    "type": "string",
+                    "description": "New assignee username or email"
+                },
+                "labels": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "New labels"
+                }
+            },
+            "required": ["issue_key"]
+        }
+    ),
+    Tool(
+        name="jira_add_comment",
+        description="Add a comment to a Jira issue",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "issue_key": {
+                    "type": "string",
+                    "description": "Issue key (e.g., 'PROJ-123')"
+                },
+                "comment": {
+                    "type": "string",
+                    "description": "Comment text (supports Jira markdown)"
+                }
+            },
+            "required": ["issue_key", "comment"]
+        }
+    ),
+    Tool(
+        name="jira_transition_issue",
+        description="Change the status of a Jira issue (e.g., move to In Progress, Done)",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "issue_key": {
+                    "type": "string",
+                    "description": "Issue key (e.g., 'PROJ-123')"
+                },
+                "transition": {
+                    "type": "string",
+                    "description": "Transition name or ID (e.g., 'In Progress', 'Done', '21')"
+                },
+                "comment": {
+                    "type": "string",
+                    "description": "Optional comment when transitioning"
+                },
+                "cache_bypass": {
+                    "type": "boolean",
+                    "description": "Skip the transitions cache and re-fetch from Jira",
+                    "default": False
+                }
+            },
+            "required": ["issue_key", "transition"]
+        }
+    ),
+    Tool(
+        name="jira_get_transitions",
+        description="Get available transitions (status changes) for a Jira issue",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "issue_key": {
+                    "type": "string",
+                    "description": "Issue key (e.g., 'PROJ-123')"
+                },
+                "cache_bypass": {
+                    "type": "boolean",
+                    "description": "Skip the transitions cache and re-fetch from Jira",
+                    "default": False
+                }
+            },
+            "required": ["issue_key"]
+        }
+    ),
+    Tool(
+        name="jira_resolve_field_value",
+        description="Resolve a fuzzy value for a categorical Jira field (fixVersion, component, "
+                    "labels, priority, status) to the closest valid values, avoiding JQL errors "
+                    "from guessed values",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "field": {
+                    "type": "string",
+                    "enum": ["fixVersion", "component", "labels", "priority", "status"],
+                    "description": "Field whose values should be searched"
+                },
+                "query": {
+                    "type": "string",
+                    "description": "Approximate value to resolve (e.g., 'v2.1 relase')"
+                },
+                "project": {
+                    "type": "string",
+                    "description": "Project key; required for fixVersion and component"
+                }
+            },
+            "required": ["field", "query"]
+        }
+    ),
+    Tool(
+        name="jira_list_projects",
+        description="List all accessible Jira projects",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "include_archived": {
+                    "type": "boolean",
+                    "description": "Include archived projects",
+                    "default": False
+                },
+                "cache_bypass": {
+                    "type": "boolean",
+                    "description": "Skip the projects cache and re-fetch from Jira",
+                    "default": False
                 }
             }
-        ),
-    ]
+        }
+    ),
+
+]
+
+
+@server.list_tools()
+async def list_tools() -> List[Tool]:
+    """List available Jira tools."""
+    return _TOOLS
 
 
 @server.call_tool()
 async def call_tool(name: str, arguments: Dict[str, Any]) -> List[TextContent]:
-    """Handle tool calls."""
-    try:
-        jira = get_jira_client()
-        
-        if name == "jira_search_issues":
-            jql = arguments["jql"]
-            max_results = arguments.get("max_results", 50)
-            fields = arguments.get("fields")
-            
-            issues = jira.search_issues(jql, maxResults=max_results, fields=fields)
-            
-            results = []
-            for issue in issues:
-                issue_data = {
-                    "key": issue.key,
-                    "summary": issue.fields.summary,
-                    "status": issue.fields.status.name,
-                    "issue_type": issue.fields.issuetype.name,
-                    "assignee": issue.fields.assignee.displayName if issue.fields.assignee else "Unassigned",
-                    "reporter": issue.fields.reporter.displayName if issue.fields.reporter else None,
-                    "priority": issue.fields.priority.name if issue.fields.priority else None,
-                    "created": str(issue.fields.created),
-                    "updated": str(issue.fields.updated),
-                }
-                results.append(issue_data)
-            
-            return [TextContent(
-                type="text",
-                text=f"Found {len(results)} issue(s):\n\n" + json.dumps(results, indent=2)
-            )]
-        
-        elif name == "jira_get_issue":
-            issue_key = arguments["issue_key"]
-            expand = arguments.get("expand")
-            
-            issue = jira.issue(issue_key, expand=",".join(expand) if expand else None)
-            
-            issue_data = {
-                "key": issue.key,
-                "summary": issue.fields.summary,
-                "description": issue.fields.description,
-                "status": issue.fields.status.name,
-                "issue_type": issue.fields.issuetype.name,
-                "assignee": issue.fields.assignee.displayName if issue.fields.assignee else "Unassigned",
-                "reporter": issue.fields.reporter.displayName if issue.fields.reporter else None,
-                "priority": issue.fields.priority.name if issue.fields.priority else None,
-                "labels": issue.fields.labels,
-                "created": str(issue.fields.created),
-                "updated": str(issue.fields.updated),
-                "url": f"{jira.client_info()}/browse/{issue.key}"
-            }
-            
-            # Add comments if expanded
-            if expand and "comments" in expand:
-                comments = jira.comments(issue)
-                issue_data["comments"] = [
-                    {
-                        "author": c.author.displayName,
-                        "body": c.body,
-                        "created": str(c.created)
-                    }
-                    for c in comments
-                ]
-            
-            return [TextContent(
-                type="text",
-                text=json.dumps(issue_data, indent=2)
-            )]
-        
-        elif name == "jira_create_issue":
-            project = arguments["project"]
-            summary = arguments["summary"]
-            description = arguments.get("description", "")
-            issue_type = arguments.get("issue_type", "Task")
-            priority = arguments.get("priority")
-            assignee = arguments.get("assignee")
-            labels = arguments.get("labels", [])
-            
-            issue_dict = {
-                "project": {"key": project},
-                "summary": summary,
-                "description": description,
-                "issuetype": {"name": issue_type},
-            }
-            
-            if priority:
-                issue_dict["priority"] = {"name": priority}
-            
-            if assignee:
-                issue_dict["assignee"] = {"name": assignee}
-            
-            if labels:
-                issue_dict["labels"] = labels
-            
-            new_issue = jira.create_issue(fields=issue_dict)
-            
-            return [TextContent(
-                type="text",
-                text=f"✅ Issue created successfully!\n\n"
-                     f"Key: {new_issue.key}\n"
-                     f"URL: {jira.client_info()}/browse/{new_issue.key}\n"
-                     f"Summary: {summary}"
-            )]
-        
-        elif name == "jira_update_issue":
-            issue_key = arguments["issue_key"]
-            
-            issue = jira.issue(issue_key)
-            update_fields = {}
-            
-            if "summary" in arguments:
-                update_fields["summary"] = arguments["summary"]
-            
-            if "description" in arguments:
-                update_fields["description"] = arguments["description"]
-            
-            if "priority" in arguments:
-                update_fields["priority"] = {"name": arguments["priority"]}
-            
-            if "assignee" in arguments:
-                update_fields["assignee"] = {"name": arguments["assignee"]}
-            
-            if "labels" in arguments:
-                update_fields["labels"] = arguments["labels"]
-            
-            issue.update(fields=update_fields)
-            
-            return [TextContent(
-                type="text",
-                text=f"✅ Issue {issue_key} updated successfully!"
-            )]
-        
-        elif name == "jira_add_comment":
-            issue_key = arguments["issue_key"]
-            comment = arguments["comment"]
-            
-            jira.add_comment(issue_key, comment)
-            
-            return [TextContent(
-                type="text",
-                text=f"✅ Comment added to {issue_key}"
-            )]
-        
-        elif name == "jira_transition_issue":
-            issue_key = arguments["issue_key"]
-            transition = arguments["transition"]
-            comment = arguments.get("comment")
-            
-            # Get available transitions
-            transitions = jira.transitions(issue_key)
-            
-            # Find matching transition by name or ID
-            transition_id = None
-            for t in transitions:
-                if t["name"].lower() == transition.lower() or t["id"] == transition:
-                    transition_id = t["id"]
-                    transition_name = t["name"]
-                    break
-            
-            if not transition_id:
-                available = ", ".join([t["name"] for t in transitions])
-                return [TextContent(
-                    type="text",
-                    text=f"❌ Transition '{transition}' not found.\n\n"
-                         f"Available transitions: {available}"
-                )]
-            
-            # Perform transition
-            jira.transition_issue(issue_key, transition_id, comment=comment)
-            
-            return [TextContent(
-                type="text",
-                text=f"✅ Issue {issue_key} transitioned to '{transition_name}'"
-            )]
-        
-        elif name == "jira_get_transitions":
-            issue_key = arguments["issue_key"]
-            
-            transitions = jira.transitions(issue_key)
-            
-            result = {
-                "issue": issue_key,
-                "available_transitions": [
-                    {
-                        "id": t["id"],
-                        "name": t["name"],
-                        "to_status": t["to"]["name"]
-                    }
-                    for t in transitions
-                ]
+    """Handle tool calls.
+
+    All Jira I/O is blocking (the jira library sits on requests), so the
+    actual work runs in a worker thread via asyncio.to_thread. This keeps the
+    event loop free to serve other MCP requests concurrently instead of
+    stalling the whole server on every Jira round-trip.
+    """
+    return await asyncio.to_thread(_call_tool_sync, name, arguments)
+
+
+def _handle_search_issues(jira: JIRA, arguments: Dict[str, Any]) -> List[TextContent]:
+    jql = arguments["jql"]
+    max_results = arguments.get("max_results", 50)
+    fields = arguments.get("fields") or SEARCH_DEFAULT_FIELDS
+
+    # Kept local: the client is shared across worker threads, so writing the
+    # per-call batch size onto it would race concurrent searches
+    batch_size = arguments.get("batch_size", DEFAULT_SEARCH_BATCH_SIZE)
+    if getattr(jira, "_is_cloud", False):
+        # Cloud always goes through the token loop: even a single bounded
+        # request can come back capped below max_results by the server
+        issues = _search_issues_cloud(jira, jql, max_results, fields, batch_size)
+    elif max_results and max_results <= batch_size:
+        # Fits in a single request; no need to window. json_result
+        # skips per-issue Resource construction entirely.
+        result = jira.search_issues(
+            jql, maxResults=max_results, fields=fields, json_result=True
+        )
+        issues = result.get("issues", [])
+    else:
+        issues = _search_issues_parallel(jira, jql, max_results, fields, batch_size)
+
+    return [TextContent(
+        type="text",
+        text=f"Found {len(issues)} issue(s):\n\n" + _serialize_search_results(issues)
+    )]
+
+
+def _handle_get_issue(jira: JIRA, arguments: Dict[str, Any]) -> List[TextContent]:
+    issue_key = arguments["issue_key"]
+    expand = arguments.get("expand")
+    fields = list(arguments.get("fields") or ISSUE_DEFAULT_FIELDS)
+
+    # Comments ride along on the issue response via the comment field, so
+    # requesting them up front saves the separate /comment round-trip
+    want_comments = bool(expand) and "comments" in expand
+    if want_comments and "comment" not in fields:
+        fields.append("comment")
+
+    issue = jira.issue(
+        issue_key,
+        fields=",".join(fields),
+        expand=",".join(expand) if expand else None
+    )
+
+    issue_data = _issue_to_dict(issue)
+
+    if want_comments:
+        comment_field = getattr(issue.fields, "comment", None)
+        issue_data["comments"] = [
+            {
+                "author": c.author.displayName,
+                "body": c.body,
+                "created": str(c.created)
             }
-            
-            return [TextContent(
-                type="text",
-                text=json.dumps(result, indent=2)
-            )]
-        
-        elif name == "jira_list_projects":
-            include_archived = arguments.get("include_archived", False)
-            
-            projects = jira.projects()
-            
-            result = []
-            for project in projects:
-                # Filter archived projects if needed
-                if not include_archived and hasattr(project, 'archived') and project.archived:
-                    continue
-                
-                result.append({
-                    "key": project.key,
-                    "name": project.name,
-                    "lead": project.lead.displayName if hasattr(project, 'lead') else None,
-                    "url": f"{jira.client_info()}/browse/{project.key}"
-                })
-            
-            return [TextContent(
-                type="text",
-                text=f"Found {len(result)} project(s):\n\n" + json.dumps(result, indent=2)
-            )]
-        
+            for c in (comment_field.comments if comment_field else [])
+        ]
+
+    return [TextContent(
+        type="text",
+        text=_dumps(issue_data)
+    )]
+
+
+def _handle_get_issues_bulk(jira: JIRA, arguments: Dict[str, Any]) -> List[TextContent]:
+    issue_keys = arguments["issue_keys"]
+    max_workers = arguments.get("max_workers", 5)
+
+    fetched: Dict[str, Dict[str, Any]] = {}
+    errors = []
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        futures = {
+            pool.submit(jira.issue, key, fields=",".join(ISSUE_DEFAULT_FIELDS)): key
+            for key in issue_keys
+        }
+        for future in as_completed(futures):
+            key = futures[future]
+            try:
+                fetched[key] = _issue_to_dict(future.result())
+            except Exception as e:
+                logger.warning("Failed to fetch issue %s: %s", key, e)
+                errors.append({"key": key, "error": str(e)})
+
+    result = {"issues": [fetched[key] for key in issue_keys if key in fetched]}
+    if errors:
+        result["errors"] = errors
+
+    return [TextContent(
+        type="text",
+        text=f"Fetched {len(fetched)} of {len(issue_keys)} issue(s):\n\n" + _dumps(result)
+    )]
+
+
+def _issue_fields_dict(spec: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert a tool-level issue spec into Jira's fields dict shape."""
+    fields = {
+        "project": {"key": spec["project"]},
+        "summary": spec["summary"],
+        "description": spec.get("description", ""),
+        "issuetype": {"name": spec.get("issue_type", "Task")},
+    }
+
+    if spec.get("priority"):
+        fields["priority"] = {"name": spec["priority"]}
+
+    if spec.get("assignee"):
+        fields["assignee"] = {"name": spec["assignee"]}
+
+    if spec.get("labels"):
+        fields["labels"] = spec["labels"]
+
+    return fields
+
+
+def _handle_create_issue(jira: JIRA, arguments: Dict[str, Any]) -> List[TextContent]:
+    summary = arguments["summary"]
+
+    new_issue = jira.create_issue(fields=_issue_fields_dict(arguments))
+
+    return [TextContent(
+        type="text",
+        text=f"✅ Issue created successfully!\n\n"
+             f"Key: {new_issue.key}\n"
+             f"URL: {_base_url()}/browse/{new_issue.key}\n"
+             f"Summary: {summary}"
+    )]
+
+
+def _handle_create_issues_bulk(jira: JIRA, arguments: Dict[str, Any]) -> List[TextContent]:
+    specs = arguments["issues"]
+
+    # One POST to /rest/api/2/issue/bulk instead of one per issue
+    results = jira.create_issues(field_list=[_issue_fields_dict(spec) for spec in specs])
+
+    created = []
+    errors = []
+    for spec, result in zip(specs, results):
+        if result.get("status") == "Success" and result.get("issue") is not None:
+            created.append(result["issue"].key)
         else:
-            return [TextContent(
-                type="text",
-                text=f"❌ Unknown tool: {name}"
-            )]
-    
-    except JIRAError as e:
+            errors.append({
+                "summary": spec.get("summary"),
+                "error": str(result.get("error"))
+            })
+
+    response = {"created": created}
+    if errors:
+        response["errors"] = errors
+
+    return [TextContent(
+        type="text",
+        text=f"✅ Created {len(created)} of {len(specs)} issue(s):\n\n" + _dumps(response)
+    )]
+
+
+def _handle_update_issue(jira: JIRA, arguments: Dict[str, Any]) -> List[TextContent]:
+    issue_key = arguments["issue_key"]
+
+    update_fields = {}
+
+    if "summary" in arguments:
+        update_fields["summary"] = arguments["summary"]
+
+    if "description" in arguments:
+        update_fields["description"] = arguments["description"]
+
+    if "priority" in arguments:
+        update_fields["priority"] = {"name": arguments["priority"]}
+
+    if "assignee" in arguments:
+        update_fields["assignee"] = {"name": arguments["assignee"]}
+
+    if "labels" in arguments:
+        update_fields["labels"] = arguments["labels"]
+
+    # PUT directly instead of fetching the issue first; the update
+    # endpoint only needs the key, so the GET was pure overhead
+    jira._session.put(
+        f"{jira._options['server']}/rest/api/2/issue/{issue_key}",
+        json={"fields": update_fields}
+    )
+
+    _transitions_cache.invalidate(issue_key)
+
+    return [TextContent(
+        type="text",
+        text=f"✅ Issue {issue_key} updated successfully!"
+    )]
+
+
+def _handle_add_comment(jira: JIRA, arguments: Dict[str, Any]) -> List[TextContent]:
+    issue_key = arguments["issue_key"]
+    comment = arguments["comment"]
+
+    jira.add_comment(issue_key, comment)
+
+    return [TextContent(
+        type="text",
+        text=f"✅ Comment added to {issue_key}"
+    )]
+
+
+def _handle_transition_issue(jira: JIRA, arguments: Dict[str, Any]) -> List[TextContent]:
+    issue_key = arguments["issue_key"]
+    transition = arguments["transition"]
+    comment = arguments.get("comment")
+
+    # Get available transitions
+    transitions = _get_transitions(jira, issue_key, arguments.get("cache_bypass", False))
+
+    # Find matching transition by name or ID
+    transition_id = None
+    for t in transitions:
+        if t["name"].lower() == transition.lower() or t["id"] == transition:
+            transition_id = t["id"]
+            transition_name = t["name"]
+            break
+
+    if not transition_id:
+        available = ", ".join([t["name"] for t in transitions])
         return [TextContent(
             type="text",
-            text=f"❌ Jira Error: {e.status_code} - {e.text}"
+            text=f"❌ Transition '{transition}' not found.\n\n"
+                 f"Available transitions: {available}"
+        )]
+
+    # Perform transition
+    jira.transition_issue(issue_key, transition_id, comment=comment)
+
+    # The issue moved in its workflow, so its transition set changed
+    _transitions_cache.invalidate(issue_key)
+
+    return [TextContent(
+        type="text",
+        text=f"✅ Issue {issue_key} transitioned to '{transition_name}'"
+    )]
+
+
+def _handle_get_transitions(jira: JIRA, arguments: Dict[str, Any]) -> List[TextContent]:
+    issue_key = arguments["issue_key"]
+
+    transitions = _get_transitions(jira, issue_key, arguments.get("cache_bypass", False))
+
+    result = {
+        "issue": issue_key,
+        "available_transitions": [
+            {
+                "id": t["id"],
+                "name": t["name"],
+                "to_status": t["to"]["name"]
+            }
+            for t in transitions
+        ]
+    }
+
+    return [TextContent(
+        type="text",
+        text=_dumps(result)
+    )]
+
+
+def _handle_resolve_field_value(jira: JIRA, arguments: Dict[str, Any]) -> List[TextContent]:
+    field = arguments["field"]
+    query = arguments["query"]
+    project = arguments.get("project")
+
+    if field in ("fixVersion", "component") and not project:
+        return [TextContent(
+            type="text",
+            text=f"❌ Field '{field}' requires a project"
+        )]
+
+    if field == "labels" and not getattr(jira, "_is_cloud", False):
+        return [TextContent(
+            type="text",
+            text="❌ Field 'labels' is only supported on Jira Cloud "
+                 "(Server/Data Center has no label list endpoint)"
+        )]
+
+    cache_key = (field, project)
+    values = _field_values_cache.get(cache_key)
+    if values is None:
+        values = _fetch_field_values(jira, field, project)
+        _field_values_cache.set(cache_key, values)
+
+    # Rank all known values by string similarity; one local pass replaces
+    # the guess-and-400 JQL retry loop
+    query_lower = query.lower()
+    scored = sorted(
+        (
+            (difflib.SequenceMatcher(None, query_lower, value.lower()).ratio(), value)
+            for value in values
+        ),
+        key=lambda pair: pair[0],
+        reverse=True
+    )
+
+    result = {
+        "field": field,
+        "query": query,
+        "matches": [
+            {"value": value, "score": round(score, 3)}
+            for score, value in scored[:10]
+        ]
+    }
+
+    return [TextContent(
+        type="text",
+        text=_dumps(result)
+    )]
+
+
+def _handle_list_projects(jira: JIRA, arguments: Dict[str, Any]) -> List[TextContent]:
+    include_archived = arguments.get("include_archived", False)
+
+    cache_key = ("projects", include_archived)
+    projects = None
+    if not arguments.get("cache_bypass", False):
+        projects = _projects_cache.get(cache_key)
+    if projects is None:
+        projects = _fetch_projects(jira, include_archived)
+        _projects_cache.set(cache_key, projects)
+
+    result = [
+        {
+            "key": project.get("key"),
+            "name": project.get("name"),
+            "lead": (project.get("lead") or {}).get("displayName"),
+            "url": f"{_base_url()}/browse/{project.get('key')}"
+        }
+        for project in projects
+    ]
+
+    return [TextContent(
+        type="text",
+        text=f"Found {len(result)} project(s):\n\n" + _dumps(result)
+    )]
+
+
+# O(1) dispatch instead of a long if/elif ladder; each handler is an
+# independent function so new tools only need an entry here
+_HANDLERS: Dict[str, Callable[[JIRA, Dict[str, Any]], List[TextContent]]] = {
+    "jira_search_issues": _handle_search_issues,
+    "jira_get_issue": _handle_get_issue,
+    "jira_get_issues_bulk": _handle_get_issues_bulk,
+    "jira_create_issue": _handle_create_issue,
+    "jira_create_issues_bulk": _handle_create_issues_bulk,
+    "jira_update_issue": _handle_update_issue,
+    "jira_add_comment": _handle_add_comment,
+    "jira_transition_issue": _handle_transition_issue,
+    "jira_get_transitions": _handle_get_transitions,
+    "jira_resolve_field_value": _handle_resolve_field_value,
+    "jira_list_projects": _handle_list_projects,
+}
+
+
+def _call_tool_sync(name: str, arguments: Dict[str, Any]) -> List[TextContent]:
+    """Synchronous tool dispatch; runs in a worker thread."""
+    handler = _HANDLERS.get(name)
+    if handler is None:
+        return [TextContent(
+            type="text",
+            text=f"❌ Unknown tool: {name}"
         )]
-    
+
+    retry_in = _circuit.seconds_until_retry()
+    if retry_in is not None:
+        return [TextContent(
+            type="text",
+            text=f"❌ Jira unavailable (circuit open, retrying in {retry_in:.0f}s)"
+        )]
+
+    try:
+        result = handler(get_jira_client(), arguments)
+        _circuit.record_success()
+        return result
+
     except Exception as e:
+        return _format_tool_error(e)
+
+
+def _format_tool_error(e: Exception) -> List[TextContent]:
+    """Map an exception to the tool error response, feeding the breaker.
+
+    5xx, exhausted retries, connection errors, and timeouts look like an
+    outage and count toward the circuit breaker; 4xx (including rate
+    limiting, which retries already absorbed) does not. The exception
+    types are resolved lazily —
+    if a Jira call raised, the jira/requests stack is already imported.
+    """
+    try:
+        import requests
+        from jira.exceptions import JIRAError
+    except ImportError:
+        # jira itself failed to import; surface that as-is
         return [TextContent(
             type="text",
             text=f"❌ Error: {str(e)}"
         )]
 
+    if isinstance(e, JIRAError):
+        if e.status_code and e.status_code >= 500:
+            _circuit.record_failure()
+        return [TextContent(
+            type="text",
+            text=f"❌ Jira Error: {e.status_code} - {e.text}"
+        )]
+
+    if isinstance(e, requests.exceptions.RetryError):
+        # A sustained 5xx exhausts the urllib3 status retries and surfaces
+        # here rather than as a JIRAError or connection error
+        _circuit.record_failure()
+        return [TextContent(
+            type="text",
+            text=f"❌ Jira Error: retries exhausted - {str(e)}"
+        )]
+
+    if isinstance(e, (requests.ConnectionError, requests.Timeout)):
+        _circuit.record_failure()
+
+    return [TextContent(
+        type="text",
+        text=f"❌ Error: {str(e)}"
+    )]
+
 
 if __name__ == "__main__":
     asyncio.run(server.run())